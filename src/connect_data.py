@@ -1,5 +1,8 @@
 import json
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from functools import lru_cache
+from typing import Optional
 
 import pandas as pd
 
@@ -17,12 +20,41 @@ def read_json_file(file_path: str) -> pd.DataFrame:
         return pd.DataFrame.from_dict(data)
 
 
-def read_csv_file(file_path: str) -> pd.DataFrame:
+def read_csv_file(file_path: str, schema: Optional[dict] = None) -> pd.DataFrame:
     """read a csv file as DataFrame
 
     :param file_path: path of file
+    :param schema: data schema, used to read only schema columns with final types
     """
-    return pd.read_csv(file_path)
+    if schema is None:
+        return pd.read_csv(file_path)
+
+    dtype = {
+        key: value["type"]
+        for key, value in schema.items()
+        if value["type"] in (int, float, str)
+    }
+    date_columns = [key for key, value in schema.items() if value["type"] == "date"]
+    date_formats = {
+        key: schema[key]["format"] for key in date_columns if schema[key].get("format")
+    }
+    return pd.read_csv(
+        file_path,
+        usecols=list(schema),
+        dtype=dtype,
+        parse_dates=date_columns,
+        date_format=date_formats or None,
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_schema_file(schema_path: str) -> dict:
+    """read schema file once and share it among all schemas of sources
+
+    :param schema_path: path of schema file
+    """
+    with open(schema_path) as f:
+        return json.load(f)
 
 
 class DataSchema:
@@ -37,10 +69,9 @@ class DataSchema:
             self._schema = self._get_schema(self.source_name)
         return self._schema
 
-    def _get_schema(self) -> dict:
-        with open(self.schema_path) as f:
-            schema = json.load(f)
-            return schema.get(self.source_name)
+    def _get_schema(self, source_name: str) -> dict:
+        # copy so edits to one schema do not leak into the shared cached file
+        return deepcopy(_load_schema_file(self.schema_path).get(source_name))
 
 
 class BaseValidator(ABC):
@@ -64,13 +95,18 @@ class BaseValidator(ABC):
 
 
 class IntegerValidator(BaseValidator):
+    def __init__(self, schema: dict) -> None:
+        super().__init__(schema)
+        value_mapping = self.schema.get("value_mapping")
+        self._mapping = self._get_mapping(value_mapping) if value_mapping else None
+
     def _transform_type(self, data: pd.Series) -> pd.Series:
         """transform data type by schema"""
         try:
             data = data.astype(self.schema["type"])
         except ValueError:
             raise ValidationError(
-                "Data %s is not valid type: %s" % data, self.schema["type"]
+                "Data %s is not valid type: %s" % (data, self.schema["type"])
             )
         return data
 
@@ -87,10 +123,8 @@ class IntegerValidator(BaseValidator):
 
     def _map_value(self, data: pd.Series) -> pd.Series:
         """map current value to target value based on schema"""
-        value_mapping = self.schema.get("value_mapping")
-        if value_mapping:
-            mapping = self._get_mapping(value_mapping)
-            data = data.map(mapping)
+        if self._mapping:
+            data = data.map(self._mapping)
         return data
 
 
@@ -101,10 +135,10 @@ class DateValidator(BaseValidator):
     def _transform_type(self, data: pd.Series) -> pd.Series:
         """transform data type by schema"""
         try:
-            data = pd.to_datetime(data)
+            data = pd.to_datetime(data, format=self.schema.get("format"), cache=True)
         except ValueError:
             raise ValidationError(
-                "Data %s is not valid type: %s" % data, self.schema["type"]
+                "Data %s is not valid type: %s" % (data, self.schema["type"])
             )
         return data
 
@@ -113,7 +147,8 @@ class ChoicesValidator(StringValidator):
     def validate(self, data: pd.Series) -> pd.Series:
         """validate data values are subset of choices"""
         data = super().validate(data)
-        diff = set(data).difference(self.schema["choices"])
+        # unique works on the codes for categorical data and keeps missing values
+        diff = set(data.unique()).difference(self.schema["choices"])
         if diff:
             raise ValidationError(f"Value is not subset of choices: {diff}")
         return data
@@ -143,7 +178,8 @@ class DataFrameValidator:
         :param schema: data schema
         :param data: data to be validated
         """
+        columns = {}
         for key, value in schema.items():
             validator = self.factory.get_validator(value)
-            data.loc[:, key] = validator.validate(data.loc[:, key])
-        return data
+            columns[key] = validator.validate(data.loc[:, key])
+        return data.assign(**columns)
@@ -1,5 +1,6 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from errors import ValidationError
@@ -20,18 +21,25 @@ sales_data_schema = {
             "Beeblizox": ["Beebliz%C3%B6x"],
         },
     },
-    "date": {"type": "date"},
+    "date": {"type": "date", "format": "ISO8601"},
     "unit_sales": {"type": int},
     "created_at": {"type": "date"},
 }
 
+# canonical dtypes so every sales chunk shares one block layout before concat
+sales_data_dtypes = {
+    "acct_id": "string",
+    "product_name": pd.CategoricalDtype(sales_data_schema["product_name"]["choices"]),
+    "unit_sales": "int32",
+}
+
 crm_data_schema = {
     "acct_id": {"type": str},
     "event_type": {
         "type": str,
         "choices": ["f2f", "group call", "workplace event"],
     },
-    "date": {"type": "date"},
+    "date": {"type": "date", "format": "ISO8601"},
 }
 
 # assumption: logging is saved to a file for monitoring
@@ -51,23 +59,29 @@ def sales_to_market_share_pipeline() -> pd.DataFrame:
     """read sales data, transform to market share data
     """
     validator = DataFrameValidator()
-    sales_data = []
+    file_paths = []
     for file_path in os.listdir(settings.SALES_DATA_PATH):
         if not file_path.endswith(".json"):
             msg = "Sales data should be json files: %s" % file_path
             logger.error(msg)
             raise ValueError(msg)
+        file_paths.append(os.path.join(settings.SALES_DATA_PATH, file_path))
 
-        data = read_json_file(os.path.join(settings.SALES_DATA_PATH, file_path))
+    # reading is I/O bound, so overlap file reads across threads
+    with ThreadPoolExecutor() as executor:
+        raw_data = list(executor.map(read_json_file, file_paths))
 
+    sales_data = []
+    for data in raw_data:
         try:
             data = validator.validate(sales_data_schema, data)
         except ValidationError as e:
             logger.error(e)
             raise
 
+        data = data.astype(sales_data_dtypes)
         sales_data.append(data)
-    sales_data = pd.concat(sales_data, axis=0)
+    sales_data = pd.concat(sales_data, axis=0, ignore_index=True)
 
     market_share_process = MarketShareProcess(settings.SALES_WINDOW_SIZE_WEIGHTS)
     market_share = market_share_process.process(sales_data)
@@ -77,7 +91,7 @@ def sales_to_market_share_pipeline() -> pd.DataFrame:
 def crm_to_event_data_pipeline() -> pd.DataFrame:
     """read crm data, transform to event data
     """
-    crm_data = read_csv_file(settings.CRM_DATA_PATH)
+    crm_data = read_csv_file(settings.CRM_DATA_PATH, crm_data_schema)
     validator = DataFrameValidator()
 
     try:
@@ -86,6 +100,8 @@ def crm_to_event_data_pipeline() -> pd.DataFrame:
         logger.error(e)
         raise
 
+    crm_data["event_type"] = crm_data["event_type"].astype("category")
+
     market_event_process = MarketEventProcess(settings.CRM_WINDOW_SIZE_WEIGHTS)
     event_data = market_event_process.process(crm_data)
     return event_data
@@ -96,11 +112,13 @@ def pipeline() -> pd.DataFrame:
     """
     market_share = sales_to_market_share_pipeline()
     event_data = crm_to_event_data_pipeline()
-    data = pd.merge(
-        market_share, event_data, how="outer", left_index=True, right_index=True
+    data = (
+        pd.concat([market_share, event_data], axis=1, join="outer")
+        .sort_index()
+        .rename_axis("date")
     )
     data = data.reset_index(level=0)
-    data.to_csv(settings.SALES_CRM_DATA_PATH)
+    data.to_parquet(settings.SALES_CRM_DATA_PATH, engine="pyarrow", compression="zstd")
     return data
 
 
@@ -7,6 +7,33 @@ import pandas as pd
 import settings
 
 
+def _weighted_roll(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """calculate rounded weighted moving average on a raw array,
+    leading positions without a full window are NaN
+
+    :param values: contiguous float64 data
+    :param weights: weight for each position in a moving window
+    """
+    window_size = weights.size
+    out = np.full(values.shape, np.nan)
+    # np.convolve swaps its inputs when the window is longer than the data
+    if values.size >= window_size:
+        out[window_size - 1 :] = np.round(
+            np.convolve(values, weights[::-1] / weights.sum(), mode="valid"),
+            settings.DECIMAL_DIGITS,
+        )
+    return out
+
+
+def _rolling_mean(values: np.ndarray, window_size: int) -> np.ndarray:
+    """calculate rounded moving average on a raw array
+
+    :param values: contiguous float64 data
+    :param window_size: size of moving window
+    """
+    return _weighted_roll(values, np.ones(window_size))
+
+
 class BaseProcess(ABC):
     def __init__(self, window_size_to_weights: dict) -> None:
         self.window_size_to_weights = window_size_to_weights
@@ -26,13 +53,19 @@ class MarketShareProcess(BaseProcess):
 
         :param data: sales data
         """
-        data_by_product = data.groupby(["date", "product_name"]).agg(
+        data_by_product = data.groupby(["date", "product_name"], observed=True).agg(
             {"unit_sales": "sum"}
         )
+        total_sales = data_by_product.groupby(level="date")["unit_sales"].transform(
+            "sum"
+        )
+        market_share = np.round(
+            data_by_product["unit_sales"].to_numpy() / total_sales.to_numpy(),
+            settings.DECIMAL_DIGITS,
+        )
         market_share = (
-            data_by_product.groupby(level=0)
-            .apply(lambda x: np.round(x / x.sum(), settings.DECIMAL_DIGITS))
-            .rename(columns={"unit_sales": "market_share"})
+            data_by_product.assign(market_share=market_share)
+            .drop(columns="unit_sales")
             .reset_index()
         )
         return market_share
@@ -46,9 +79,11 @@ class MarketShareProcess(BaseProcess):
         :param data: market share data
         :param window_size: size (month) of moving window
         """
-        data = data.rolling(window_size).mean().apply(lambda x: np.round(x, settings.DECIMAL_DIGITS))
-        data = data.rename(f"lagged_{window_size-1}_month_avg_market_share")
-        return data
+        return pd.Series(
+            _rolling_mean(data.to_numpy(dtype=np.float64), window_size),
+            index=data.index,
+            name=f"lagged_{window_size-1}_month_avg_market_share",
+        )
 
     def process(self, data: pd.DataFrame) -> pd.DataFrame:
         """process sales data
@@ -80,12 +115,10 @@ class MarketEventProcess(BaseProcess):
         :param data: event sum data based on one month
         """
         data = (
-            data.groupby(["event_month", "event_type"])
-            .count().loc[:, "acct_id"]
+            data.groupby(["event_month", "event_type"], observed=True)
+            .size()
             .rename("event_count")
-            .unstack()
-            .fillna(0)
-            .astype(int)
+            .unstack(fill_value=0)
         )
         data.columns = [item.replace(" ", "_") for item in data.columns]
         return data
@@ -97,11 +130,10 @@ class MarketEventProcess(BaseProcess):
         :param data: event sum data based on one month
         :param window_size: size (month) of moving window
         """
-        return (
-            data.rolling(window_size)
-            .mean()
-            .apply(lambda x: np.round(x, settings.DECIMAL_DIGITS))
-            .rename(f"lagged_{window_size-1}_month_sum_events")
+        return pd.Series(
+            _rolling_mean(data.to_numpy(dtype=np.float64), window_size),
+            index=data.index,
+            name=f"lagged_{window_size-1}_month_sum_events",
         )
 
     @staticmethod
@@ -114,11 +146,18 @@ class MarketEventProcess(BaseProcess):
         :param window_size: size (month) of moving window
         :param weights: weight list for each month in a moving window
         """
-        sum_weights = np.sum(weights)
-        data = data.rolling(window=window_size).apply(
-            lambda x: np.round(np.sum(weights * x) / sum_weights, settings.DECIMAL_DIGITS), raw=False
+        if len(weights) != window_size:
+            raise ValueError(
+                "Weights %s do not match window size: %s" % (weights, window_size)
+            )
+        weighted_sum = _weighted_roll(
+            data.to_numpy(dtype=np.float64), np.asarray(weights, dtype=np.float64)
+        )
+        return pd.Series(
+            weighted_sum,
+            index=data.index,
+            name=f"lagged_{window_size-1}_month_weighted_sum_events",
         )
-        return data.rename(f"lagged_{window_size-1}_month_weighted_sum_events")
 
     def process(self, data: pd.DataFrame) -> pd.DataFrame:
         """process crm data
@@ -127,23 +166,34 @@ class MarketEventProcess(BaseProcess):
 
         :param data: crm data
         """
-        data["event_month"] = data["date"].to_numpy().astype("datetime64[M]")
+        data["event_month"] = pd.to_datetime(data["date"]).dt.to_period("M")
 
         sum_each_event_by_month = self.calculate_sum_each_event(data)
 
         sum_total_events_by_month = (
-            data.groupby(["event_month"])
-            .count()
-            .loc[:, "acct_id"]
-            .rename("event_count")
+            data.groupby("event_month").size().rename("event_count")
         )
 
-        series_list = [sum_each_event_by_month, sum_total_events_by_month]
-        for size in self.window_size_to_weights.keys():
-            data = self.calculate_lagged_sum_events(sum_total_events_by_month, size)
-            series_list.append(data)
-
+        # both moving averages read the same float64 buffer without converting
+        sum_total_events = sum_total_events_by_month.astype(np.float64)
+        lagged_sum_list = []
+        lagged_weighted_sum_list = []
         for size, weights in self.window_size_to_weights.items():
-            data = self.calculate_lagged_weighted_sum_events(sum_total_events_by_month, size, weights)
-            series_list.append(data)
-        return pd.concat(series_list, axis=1)
+            lagged_sum_list.append(
+                self.calculate_lagged_sum_events(sum_total_events, size)
+            )
+            if weights:
+                lagged_weighted_sum_list.append(
+                    self.calculate_lagged_weighted_sum_events(
+                        sum_total_events, size, weights
+                    )
+                )
+
+        series_list = [
+            sum_each_event_by_month,
+            sum_total_events_by_month,
+            *lagged_sum_list,
+            *lagged_weighted_sum_list,
+        ]
+        # month start timestamps align with the date index of market share data
+        return pd.concat(series_list, axis=1).to_timestamp()
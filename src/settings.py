@@ -8,7 +8,7 @@ PIPELINE_NAME = "sales_crm"
 SALES_DATA_PATH = ROOT_DIR.joinpath("data/landing/sales/")
 CRM_DATA_PATH = ROOT_DIR.joinpath("data/landing/crm/crm_data.csv")
 SALES_CRM_DATA_PATH = ROOT_DIR.joinpath(
-    "data/production/sales_crm/market_share_event_sum.csv"
+    "data/production/sales_crm/market_share_event_sum.parquet"
 )
 
 DECIMAL_DIGITS = 2